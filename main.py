@@ -1,705 +1,1055 @@
-import os
-import sys
-import json
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
-
-from PySide6 import QtCore, QtGui, QtWidgets
-
-
-APP_NAME = "NotePy"
-ORG_NAME = "Randomsomethings"
-SETTINGS_FILE = Path.home() / ".notepy_settings.json"
-
-
-# ----------------------------
-# Settings / State
-# ----------------------------
-
-@dataclass
-class AppState:
-    recent_files: list[str]
-    word_wrap: bool
-    font_family: str
-    font_size: int
-
-    @staticmethod
-    def defaults() -> "AppState":
-        return AppState(
-            recent_files=[],
-            word_wrap=True,
-            font_family="Segoe UI",
-            font_size=12
-        )
-
-def load_state() -> AppState:
-    try:
-        if SETTINGS_FILE.exists():
-            data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-            s = AppState.defaults()
-            for k, v in data.items():
-                if hasattr(s, k):
-                    setattr(s, k, v)
-            if not isinstance(s.recent_files, list):
-                s.recent_files = []
-            s.recent_files = [p for p in s.recent_files if isinstance(p, str)]
-            return s
-    except Exception:
-        pass
-    return AppState.defaults()
-
-def save_state(state: AppState) -> None:
-    try:
-        SETTINGS_FILE.write_text(json.dumps(state.__dict__, indent=2), encoding="utf-8")
-    except Exception:
-        pass
-
-def elide_middle(path: str, max_len: int = 60) -> str:
-    if len(path) <= max_len:
-        return path
-    head = max_len // 2 - 2
-    tail = max_len - head - 3
-    return path[:head] + "..." + path[-tail:]
-
-
-# ----------------------------
-# Home / Start Page (matches your image)
-# ----------------------------
-
-class StartPage(QtWidgets.QWidget):
-    new_file_clicked = QtCore.Signal()
-    open_folder_clicked = QtCore.Signal()
-
-    def __init__(self, app_title: str = "NotePy", parent=None):
-        super().__init__(parent)
-
-        root = QtWidgets.QHBoxLayout(self)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.setSpacing(0)
-
-        # Left rail (dark strip)
-        self.rail = QtWidgets.QFrame()
-        self.rail.setObjectName("Rail")
-        self.rail.setFixedWidth(260)
-
-        # Center
-        center = QtWidgets.QWidget()
-        center_lay = QtWidgets.QVBoxLayout(center)
-        center_lay.setContentsMargins(40, 40, 40, 40)
-        center_lay.setSpacing(0)
-        center_lay.addStretch(1)
-
-        title = QtWidgets.QLabel(app_title)
-        title.setObjectName("StartTitle")
-        title.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-
-        center_lay.addWidget(title)
-        center_lay.addSpacing(34)
-
-        cards_row = QtWidgets.QHBoxLayout()
-        cards_row.setAlignment(QtCore.Qt.AlignHCenter)
-        cards_row.setSpacing(110)
-
-        self.btn_new = QtWidgets.QToolButton()
-        self.btn_new.setObjectName("StartCard")
-        self.btn_new.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
-        self.btn_new.setText("New File")
-        self.btn_new.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon))
-        self.btn_new.setIconSize(QtCore.QSize(64, 64))
-        self.btn_new.setFixedSize(250, 175)
-
-        self.btn_folder = QtWidgets.QToolButton()
-        self.btn_folder.setObjectName("StartCard")
-        self.btn_folder.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
-        self.btn_folder.setText("Open Folder")
-        self.btn_folder.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon))
-        self.btn_folder.setIconSize(QtCore.QSize(64, 64))
-        self.btn_folder.setFixedSize(250, 175)
-
-        cards_row.addWidget(self.btn_new)
-        cards_row.addWidget(self.btn_folder)
-
-        center_lay.addLayout(cards_row)
-        center_lay.addStretch(2)
-
-        root.addWidget(self.rail)
-        root.addWidget(center, 1)
-
-        self.btn_new.clicked.connect(self.new_file_clicked.emit)
-        self.btn_folder.clicked.connect(self.open_folder_clicked.emit)
-
-
-# ----------------------------
-# Editor Tab (simple notepad tab)
-# ----------------------------
-
-class DocumentTab(QtWidgets.QWidget):
-    changed = QtCore.Signal()
-
-    def __init__(self, state: AppState, parent=None):
-        super().__init__(parent)
-        self.state = state
-        self.path: Optional[str] = None
-
-        self.editor = QtWidgets.QPlainTextEdit()
-        self.editor.textChanged.connect(self.changed.emit)
-
-        lay = QtWidgets.QVBoxLayout(self)
-        lay.setContentsMargins(12, 12, 12, 12)
-        lay.addWidget(self.editor)
-
-        self.apply_font()
-        self.apply_word_wrap(self.state.word_wrap)
-
-    def apply_font(self):
-        f = QtGui.QFont(self.state.font_family, self.state.font_size)
-        self.editor.setFont(f)
-
-    def apply_word_wrap(self, enabled: bool):
-        self.editor.setLineWrapMode(
-            QtWidgets.QPlainTextEdit.WidgetWidth if enabled else QtWidgets.QPlainTextEdit.NoWrap
-        )
-
-    def is_dirty(self) -> bool:
-        return self.editor.document().isModified()
-
-    def title(self) -> str:
-        name = os.path.basename(self.path) if self.path else "Untitled"
-        return name + (" •" if self.is_dirty() else "")
-
-    def load_file(self, path: str):
-        text = Path(path).read_text(encoding="utf-8", errors="replace")
-        self.editor.setPlainText(text)
-        self.path = path
-        self.editor.document().setModified(False)
-        self.changed.emit()
-
-    def save_to(self, path: str):
-        Path(path).write_text(self.editor.toPlainText(), encoding="utf-8")
-        self.path = path
-        self.editor.document().setModified(False)
-        self.changed.emit()
-
-
-# ----------------------------
-# Main Window
-# ----------------------------
-
-class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.state = load_state()
-        self.setWindowTitle(APP_NAME)
-        self.resize(1200, 720)
-
-        # Status bar first (so any updates won't crash)
-        self._build_status_bar()
-
-        # Editor tabs
-        self.tabs = QtWidgets.QTabWidget()
-        self.tabs.setDocumentMode(True)
-        self.tabs.setMovable(True)
-        self.tabs.setTabsClosable(True)
-        self.tabs.tabCloseRequested.connect(self.close_tab)
-        self.tabs.currentChanged.connect(self.update_status_bar)
-
-        # Start page (the image)
-        self.start_page = StartPage(APP_NAME)
-        self.start_page.new_file_clicked.connect(self.on_start_new_file)
-        self.start_page.open_folder_clicked.connect(self.on_start_open_folder)
-
-        # Stack: Start <-> Editor
-        self.stack = QtWidgets.QStackedWidget()
-        self.stack.addWidget(self.start_page)  # 0
-        self.stack.addWidget(self.tabs)        # 1
-        self.setCentralWidget(self.stack)
-
-        self._build_actions()
-        self._build_menus()
-
-        self.apply_theme()      # MUST look like your image
-        self.show_start()
-
-    # ---------------- UI: Status Bar ----------------
-
-    def _build_status_bar(self):
-        sb = QtWidgets.QStatusBar()
-        self.setStatusBar(sb)
-
-        self.lbl_file = QtWidgets.QLabel("")
-        self.lbl_pos = QtWidgets.QLabel("")
-        self.lbl_dirty = QtWidgets.QLabel("")
-
-        self.lbl_file.setMinimumWidth(420)
-
-        sb.addWidget(self.lbl_file, 1)
-        sb.addPermanentWidget(self.lbl_pos)
-        sb.addPermanentWidget(self.lbl_dirty)
-
-    def update_status_bar(self):
-        # If we're on start page, keep it quiet like the screenshot
-        if self.stack.currentIndex() == 0:
-            self.lbl_file.setText("")
-            self.lbl_pos.setText("")
-            self.lbl_dirty.setText("")
-            return
-
-        tab = self.current_tab()
-        if not tab:
-            self.lbl_file.setText("Untitled")
-            self.lbl_pos.setText("Ln 1, Col 1")
-            self.lbl_dirty.setText("Saved")
-            return
-
-        path = tab.path or "Untitled"
-        self.lbl_file.setText(elide_middle(path, 70))
-
-        cursor = tab.editor.textCursor()
-        ln = cursor.blockNumber() + 1
-        col = cursor.positionInBlock() + 1
-        self.lbl_pos.setText(f"Ln {ln}, Col {col}")
-        self.lbl_dirty.setText("Modified" if tab.is_dirty() else "Saved")
-
-    # ---------------- Navigation ----------------
-
-    def show_start(self):
-        self.stack.setCurrentIndex(0)
-        self.update_status_bar()
-
-    def show_editor(self):
-        self.stack.setCurrentIndex(1)
-        self.update_status_bar()
-
-    def on_start_new_file(self):
-        self.show_editor()
-        self.new_tab()
-
-    def on_start_open_folder(self):
-        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Open Folder", str(Path.home()))
-        if not folder:
-            return
-        # Keep the same look; just switch to editor for now.
-        self.show_editor()
-        self.new_tab()
-        self.statusBar().showMessage(f"Opened folder: {folder}", 4000)
-
-    # ---------------- Tabs / Editor ----------------
-
-    def current_tab(self) -> Optional[DocumentTab]:
-        w = self.tabs.currentWidget()
-        return w if isinstance(w, DocumentTab) else None
-
-    def new_tab(self):
-        tab = DocumentTab(self.state)
-        tab.changed.connect(self.refresh_tab_title)
-
-        idx = self.tabs.addTab(tab, tab.title())
-        self.tabs.setCurrentIndex(idx)
-        tab.editor.setFocus()
-
-        self.refresh_tab_title()
-
-    def refresh_tab_title(self):
-        tab = self.current_tab()
-        idx = self.tabs.currentIndex()
-        if tab and idx >= 0:
-            self.tabs.setTabText(idx, tab.title())
-        self.update_status_bar()
-
-    def close_tab(self, index: int):
-        if index < 0:
-            return
-        tab = self.tabs.widget(index)
-        if not isinstance(tab, DocumentTab):
-            return
-
-        if tab.is_dirty():
-            resp = QtWidgets.QMessageBox.question(
-                self,
-                "Unsaved changes",
-                f"Save changes to {os.path.basename(tab.path) if tab.path else 'Untitled'}?",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel
-            )
-            if resp == QtWidgets.QMessageBox.Cancel:
-                return
-            if resp == QtWidgets.QMessageBox.Yes:
-                if not self._save_tab(tab):
-                    return
-
-        self.tabs.removeTab(index)
-        tab.deleteLater()
-
-        if self.tabs.count() == 0:
-            # If no tabs, go back to the start screen (like a “real app”)
-            self.show_start()
-        else:
-            self.update_status_bar()
-
-    # ---------------- File Actions ----------------
-
-    def open_file(self):
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Open File", str(Path.home()),
-            "Text Files (*.txt *.md *.log *.json *.py);;All Files (*.*)"
-        )
-        if not path:
-            return
-
-        self.show_editor()
-
-        # focus existing tab if already open
-        for i in range(self.tabs.count()):
-            t = self.tabs.widget(i)
-            if isinstance(t, DocumentTab) and t.path == path:
-                self.tabs.setCurrentIndex(i)
-                return
-
-        # open into new tab
-        self.new_tab()
-        tab = self.current_tab()
-        if not tab:
-            return
-        try:
-            tab.load_file(path)
-            self._add_recent(path)
-            self.refresh_tab_title()
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Open failed", str(e))
-
-    def save_current(self):
-        tab = self.current_tab()
-        if not tab:
-            return
-        if tab.path:
-            try:
-                tab.save_to(tab.path)
-                self._add_recent(tab.path)
-                self.refresh_tab_title()
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
-        else:
-            self.save_current_as()
-
-    def save_current_as(self):
-        tab = self.current_tab()
-        if not tab:
-            return
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save As", str(Path.home() / "Untitled.txt"),
-            "Text Files (*.txt);;Markdown (*.md);;All Files (*.*)"
-        )
-        if not path:
-            return
-        try:
-            tab.save_to(path)
-            self._add_recent(path)
-            self.refresh_tab_title()
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
-
-    def _save_tab(self, tab: DocumentTab) -> bool:
-        if tab.path:
-            try:
-                tab.save_to(tab.path)
-                self._add_recent(tab.path)
-                return True
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
-                return False
-        # Save As
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save As", str(Path.home() / "Untitled.txt"),
-            "Text Files (*.txt);;Markdown (*.md);;All Files (*.*)"
-        )
-        if not path:
-            return False
-        try:
-            tab.save_to(path)
-            self._add_recent(path)
-            return True
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
-            return False
-
-    # ---------------- Recent Files ----------------
-
-    def _add_recent(self, path: str):
-        p = str(Path(path).resolve())
-        if p in self.state.recent_files:
-            self.state.recent_files.remove(p)
-        self.state.recent_files.insert(0, p)
-        self.state.recent_files = self.state.recent_files[:10]
-        save_state(self.state)
-        self._rebuild_recent_menu()
-
-    def _rebuild_recent_menu(self):
-        if not hasattr(self, "menu_recent"):
-            return
-        self.menu_recent.clear()
-        if not self.state.recent_files:
-            a = self.menu_recent.addAction("(No recent files)")
-            a.setEnabled(False)
-            return
-        for p in self.state.recent_files:
-            act = self.menu_recent.addAction(elide_middle(p, 64))
-            act.triggered.connect(lambda checked=False, path=p: self._open_recent(path))
-        self.menu_recent.addSeparator()
-        clear = self.menu_recent.addAction("Clear recent")
-        clear.triggered.connect(self._clear_recent)
-
-    def _open_recent(self, path: str):
-        if not Path(path).exists():
-            QtWidgets.QMessageBox.warning(self, "Missing file", "That file no longer exists.")
-            self.state.recent_files = [p for p in self.state.recent_files if p != path]
-            save_state(self.state)
-            self._rebuild_recent_menu()
-            return
-        self.show_editor()
-        # open it
-        self.new_tab()
-        tab = self.current_tab()
-        if tab:
-            tab.load_file(path)
-            self.refresh_tab_title()
-
-    def _clear_recent(self):
-        self.state.recent_files = []
-        save_state(self.state)
-        self._rebuild_recent_menu()
-
-    # ---------------- Menus / Actions ----------------
-
-    def _build_actions(self):
-        self.act_new = QtGui.QAction("New File", self)
-        self.act_new.setShortcut(QtGui.QKeySequence.New)
-        self.act_new.triggered.connect(self.on_start_new_file)
-
-        self.act_open = QtGui.QAction("Open…", self)
-        self.act_open.setShortcut(QtGui.QKeySequence.Open)
-        self.act_open.triggered.connect(self.open_file)
-
-        self.act_save = QtGui.QAction("Save", self)
-        self.act_save.setShortcut(QtGui.QKeySequence.Save)
-        self.act_save.triggered.connect(self.save_current)
-
-        self.act_save_as = QtGui.QAction("Save As…", self)
-        self.act_save_as.setShortcut(QtGui.QKeySequence.SaveAs)
-        self.act_save_as.triggered.connect(self.save_current_as)
-
-        self.act_quit = QtGui.QAction("Quit", self)
-        self.act_quit.setShortcut(QtGui.QKeySequence.Quit)
-        self.act_quit.triggered.connect(self.close)
-
-        self.act_about = QtGui.QAction("About NotePy", self)
-        self.act_about.triggered.connect(self._about)
-
-    def _build_menus(self):
-        mb = self.menuBar()
-
-        # Must match your screenshot labels
-        m_file = mb.addMenu("File")
-        m_edit = mb.addMenu("Edit")
-        m_view = mb.addMenu("View")
-        m_window = mb.addMenu("Window")
-        m_about = mb.addMenu("About")
-
-        m_file.addAction(self.act_new)
-        m_file.addAction(self.act_open)
-
-        self.menu_recent = m_file.addMenu("Open Recent")
-        self._rebuild_recent_menu()
-
-        m_file.addSeparator()
-        m_file.addAction(self.act_save)
-        m_file.addAction(self.act_save_as)
-        m_file.addSeparator()
-        m_file.addAction(self.act_quit)
-
-        # basic edit bindings
-        act_undo = QtGui.QAction("Undo", self)
-        act_undo.setShortcut(QtGui.QKeySequence.Undo)
-        act_undo.triggered.connect(lambda: self.current_tab() and self.current_tab().editor.undo())
-        act_redo = QtGui.QAction("Redo", self)
-        act_redo.setShortcut(QtGui.QKeySequence.Redo)
-        act_redo.triggered.connect(lambda: self.current_tab() and self.current_tab().editor.redo())
-        act_cut = QtGui.QAction("Cut", self)
-        act_cut.setShortcut(QtGui.QKeySequence.Cut)
-        act_cut.triggered.connect(lambda: self.current_tab() and self.current_tab().editor.cut())
-        act_copy = QtGui.QAction("Copy", self)
-        act_copy.setShortcut(QtGui.QKeySequence.Copy)
-        act_copy.triggered.connect(lambda: self.current_tab() and self.current_tab().editor.copy())
-        act_paste = QtGui.QAction("Paste", self)
-        act_paste.setShortcut(QtGui.QKeySequence.Paste)
-        act_paste.triggered.connect(lambda: self.current_tab() and self.current_tab().editor.paste())
-
-        m_edit.addAction(act_undo)
-        m_edit.addAction(act_redo)
-        m_edit.addSeparator()
-        m_edit.addAction(act_cut)
-        m_edit.addAction(act_copy)
-        m_edit.addAction(act_paste)
-
-        # view placeholders (keeps menus like the image)
-        act_home = QtGui.QAction("Home", self)
-        act_home.triggered.connect(self.show_start)
-        m_view.addAction(act_home)
-
-        m_about.addAction(self.act_about)
-
-    def _about(self):
-       msg = QtWidgets.QMessageBox(self)
-       msg.setWindowTitle("About NotePy")
-       msg.setTextFormat(QtCore.Qt.RichText)
-       msg.setText(
-        """
-        <b>NotePy</b><br>
-        A notepad app built by Charlie Blaize<br>
-        Version 1.0.0 (Open Source)<br><br>
-        <a href="https://github.com/CharlieB8086/NotePy">GitHub Repository</a>
-        """
-    )
-       msg.setStandardButtons(QtWidgets.QMessageBox.Ok)
-       msg.exec()
-
-
-    # ---------------- Theme (MUST look like your image) ----------------
-
-    def apply_theme(self):
-        # Dark, muted, soft: matches your screenshot vibe
-        self.setStyleSheet("""
-            QMainWindow { background: #1e1e1e; }
-            QWidget { color: rgba(255,255,255,0.60); font-size: 13px; }
-
-            /* Menu bar: subtle, almost invisible */
-            QMenuBar {
-                background: rgba(0,0,0,0.15);
-                border: 0;
-                padding: 2px 4px;
-            }
-            QMenuBar::item {
-                padding: 6px 10px;
-                color: rgba(255,255,255,0.38);
-            }
-            QMenuBar::item:selected {
-                background: rgba(255,255,255,0.06);
-                border-radius: 8px;
-                color: rgba(255,255,255,0.55);
-            }
-
-            QMenu {
-                background: #242424;
-                border: 1px solid rgba(255,255,255,0.10);
-                padding: 6px;
-                border-radius: 10px;
-            }
-            QMenu::item { padding: 8px 12px; border-radius: 8px; color: rgba(255,255,255,0.60); }
-            QMenu::item:selected { background: rgba(255,255,255,0.08); }
-
-            /* Left rail */
-            QFrame#Rail {
-                background: #121212;
-                border-right: 1px solid rgba(255,255,255,0.08);
-            }
-
-            /* Big center title */
-            QLabel#StartTitle {
-                font-size: 84px;
-                font-weight: 300;
-                color: rgba(255,255,255,0.14);
-                letter-spacing: 1px;
-            }
-
-            /* Start cards */
-            QToolButton#StartCard {
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.10);
-                border-radius: 18px;
-                padding-top: 14px;
-                color: rgba(255,255,255,0.36);
-            }
-            QToolButton#StartCard:hover {
-                background: rgba(255,255,255,0.08);
-                border: 1px solid rgba(255,255,255,0.14);
-                color: rgba(255,255,255,0.52);
-            }
-            QToolButton#StartCard:pressed {
-                background: rgba(255,255,255,0.05);
-            }
-
-            /* Tabs + editor (kept low-contrast) */
-            QTabWidget::pane { border: 0; background: transparent; }
-            QTabBar::tab {
-                background: rgba(255,255,255,0.05);
-                border: 1px solid rgba(255,255,255,0.08);
-                padding: 8px 12px;
-                margin-right: 6px;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                color: rgba(255,255,255,0.50);
-            }
-            QTabBar::tab:selected {
-                background: rgba(255,255,255,0.07);
-                border-color: rgba(255,255,255,0.12);
-                color: rgba(255,255,255,0.70);
-            }
-
-            QPlainTextEdit {
-                background: #171717;
-                border: 1px solid rgba(255,255,255,0.10);
-                border-radius: 14px;
-                padding: 12px;
-                color: rgba(255,255,255,0.72);
-                selection-background-color: rgba(255,255,255,0.16);
-            }
-
-            QStatusBar {
-                background: rgba(0,0,0,0.15);
-                border-top: 1px solid rgba(255,255,255,0.08);
-                color: rgba(255,255,255,0.40);
-            }
-        """)
-
-    # ---------------- Close safety ----------------
-
-    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
-        # Ask to save dirty tabs
-        for i in range(self.tabs.count()):
-            tab = self.tabs.widget(i)
-            if isinstance(tab, DocumentTab) and tab.is_dirty():
-                self.tabs.setCurrentIndex(i)
-                resp = QtWidgets.QMessageBox.question(
-                    self,
-                    "Unsaved changes",
-                    f"Save changes to {os.path.basename(tab.path) if tab.path else 'Untitled'}?",
-                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel
-                )
-                if resp == QtWidgets.QMessageBox.Cancel:
-                    event.ignore()
-                    return
-                if resp == QtWidgets.QMessageBox.Yes:
-                    if not self._save_tab(tab):
-                        event.ignore()
-                        return
-
-        save_state(self.state)
-        event.accept()
-
-
-# ----------------------------
-# Main
-# ----------------------------
-
-def main():
-    QtCore.QCoreApplication.setOrganizationName(ORG_NAME)
-    QtCore.QCoreApplication.setApplicationName(APP_NAME)
-
-    app = QtWidgets.QApplication(sys.argv)
-
-    win = MainWindow()
-    win.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
+import codecs
+import functools
+import mmap
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode("utf-8")
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+
+APP_NAME = "NotePy"
+ORG_NAME = "Randomsomethings"
+SETTINGS_FILE = Path.home() / ".notepy_settings.json"
+
+# Files bigger than this are streamed into the editor in chunks so the
+# UI stays responsive instead of stalling on one giant setPlainText.
+LARGE_FILE_BYTES = 1 << 20
+LOAD_CHUNK_BYTES = 256 * 1024
+
+
+# ----------------------------
+# Settings / State
+# ----------------------------
+
+@dataclass
+class AppState:
+    recent_files: list[str]
+    word_wrap: bool
+    font_family: str
+    font_size: int
+
+    @staticmethod
+    def defaults() -> "AppState":
+        return AppState(
+            recent_files=[],
+            word_wrap=True,
+            font_family="Segoe UI",
+            font_size=12
+        )
+
+def load_state() -> AppState:
+    try:
+        if SETTINGS_FILE.exists():
+            data = _loads(SETTINGS_FILE.read_bytes())
+            s = AppState.defaults()
+            for k, v in data.items():
+                if hasattr(s, k):
+                    setattr(s, k, v)
+            if not isinstance(s.recent_files, list):
+                s.recent_files = []
+            s.recent_files = [p for p in s.recent_files if isinstance(p, str)]
+            return s
+    except Exception:
+        pass
+    return AppState.defaults()
+
+def _write_settings(payload: bytes) -> bool:
+    # One write syscall into a temp file, then an atomic rename: no
+    # buffered-IO wrapper, and a crash mid-write can't corrupt settings.
+    tmp = str(SETTINGS_FILE) + ".tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp, SETTINGS_FILE)
+        return True
+    except Exception:
+        return False
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(p: str) -> str:
+    # Path.resolve() stats every component; the same handful of paths
+    # get re-resolved on every open/save, so cache the answers.
+    return str(Path(p).resolve())
+
+def _basename(path: str) -> str:
+    # Leaner than os.path.basename (no normpath/drive handling) on the
+    # per-keystroke title path; copes with either separator.
+    i = max(path.rfind("/"), path.rfind("\\"))
+    return path[i + 1:]
+
+@functools.lru_cache(maxsize=512)
+def elide_middle(path: str, max_len: int = 60) -> str:
+    # Called per status-bar refresh and per recent-menu entry with the
+    # same handful of (path, max_len) pairs, so memoize the results.
+    if len(path) <= max_len:
+        return path
+    head = max_len // 2 - 2
+    tail = max_len - head - 3
+    return path[:head] + "..." + path[-tail:]
+
+
+# ----------------------------
+# Home / Start Page (matches your image)
+# ----------------------------
+
+class StartPage(QtWidgets.QWidget):
+    new_file_clicked = QtCore.Signal()
+    open_folder_clicked = QtCore.Signal()
+
+    # Shared across instances; standardIcon does a theme lookup + pixmap
+    # build per call, so fetch each icon once (lazily — it needs a live
+    # style) and reuse it.
+    ICON_SIZE = QtCore.QSize(64, 64)
+    _icon_file: Optional[QtGui.QIcon] = None
+    _icon_folder: Optional[QtGui.QIcon] = None
+
+    def __init__(self, app_title: str = "NotePy", parent=None):
+        super().__init__(parent)
+
+        if StartPage._icon_file is None:
+            style = self.style()
+            StartPage._icon_file = style.standardIcon(QtWidgets.QStyle.SP_FileIcon)
+            StartPage._icon_folder = style.standardIcon(QtWidgets.QStyle.SP_DirIcon)
+
+        root = QtWidgets.QHBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(0)
+
+        # Left rail (dark strip)
+        self.rail = QtWidgets.QFrame()
+        self.rail.setObjectName("Rail")
+        self.rail.setFixedWidth(260)
+
+        # Center
+        center = QtWidgets.QWidget()
+        center_lay = QtWidgets.QVBoxLayout(center)
+        center_lay.setContentsMargins(40, 40, 40, 40)
+        center_lay.setSpacing(0)
+        center_lay.addStretch(1)
+
+        title = QtWidgets.QLabel(app_title)
+        title.setObjectName("StartTitle")
+        title.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
+
+        center_lay.addWidget(title)
+        center_lay.addSpacing(34)
+
+        cards_row = QtWidgets.QHBoxLayout()
+        cards_row.setAlignment(QtCore.Qt.AlignHCenter)
+        cards_row.setSpacing(110)
+
+        self.btn_new = QtWidgets.QToolButton()
+        self.btn_new.setObjectName("StartCard")
+        self.btn_new.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
+        self.btn_new.setText("New File")
+        self.btn_new.setIcon(StartPage._icon_file)
+        self.btn_new.setIconSize(self.ICON_SIZE)
+        self.btn_new.setFixedSize(250, 175)
+
+        self.btn_folder = QtWidgets.QToolButton()
+        self.btn_folder.setObjectName("StartCard")
+        self.btn_folder.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
+        self.btn_folder.setText("Open Folder")
+        self.btn_folder.setIcon(StartPage._icon_folder)
+        self.btn_folder.setIconSize(self.ICON_SIZE)
+        self.btn_folder.setFixedSize(250, 175)
+
+        cards_row.addWidget(self.btn_new)
+        cards_row.addWidget(self.btn_folder)
+
+        center_lay.addLayout(cards_row)
+        center_lay.addStretch(2)
+
+        root.addWidget(self.rail)
+        root.addWidget(center, 1)
+
+        self.btn_new.clicked.connect(self.new_file_clicked.emit)
+        self.btn_folder.clicked.connect(self.open_folder_clicked.emit)
+
+
+# ----------------------------
+# Editor Tab (simple notepad tab)
+# ----------------------------
+
+class _JobSignals(QtCore.QObject):
+    chunk = QtCore.Signal(str)
+    finished = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+
+class _LoadJob(QtCore.QRunnable):
+    """Reads and decodes a file on a pool thread, emitting text chunks."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            # mmap + memoryview hands the decoder zero-copy slices of the
+            # file, so peak memory stays at one decoded copy instead of
+            # bytes-plus-str for the whole file at once.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            for i in range(0, size, LOAD_CHUNK_BYTES):
+                                end = min(i + LOAD_CHUNK_BYTES, size)
+                                chunk = decoder.decode(view[i:end], final=end == size)
+                                if chunk:
+                                    self.signals.chunk.emit(chunk)
+                        finally:
+                            view.release()
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # QSaveFile writes a temp file and renames on commit, so a crash
+    # mid-write can't corrupt the user's file. Large payloads are fed
+    # from a memoryview in 1 MB slices to avoid a second full-size copy.
+    f = QtCore.QSaveFile(path)
+    if not f.open(QtCore.QIODevice.WriteOnly | QtCore.QIODevice.Unbuffered):
+        raise OSError(f.errorString())
+    view = memoryview(data)
+    for i in range(0, len(view), 1 << 20):
+        f.write(bytes(view[i:i + (1 << 20)]))
+    if not f.commit():
+        raise OSError(f.errorString())
+
+
+class _SaveJob(QtCore.QRunnable):
+    """Writes pre-encoded bytes atomically on a pool thread."""
+
+    def __init__(self, path: str, data: bytes):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            _write_atomic(self.path, self.data)
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class DocumentTab(QtWidgets.QWidget):
+    changed = QtCore.Signal()
+    saved = QtCore.Signal(str)
+    cursor_moved = QtCore.Signal()
+    dirty_changed = QtCore.Signal()
+    load_failed = QtCore.Signal(str)
+    save_failed = QtCore.Signal(str)
+
+    def __init__(self, state: AppState, parent=None):
+        super().__init__(parent)
+        self.state = state
+        self.path: Optional[str] = None
+        self._load_job: Optional[_LoadJob] = None
+        self._save_job: Optional[_SaveJob] = None
+        self._pending_path: Optional[str] = None
+        self._last_title: str = ""
+
+        self.editor = QtWidgets.QPlainTextEdit()
+        # Cheaper large-doc editing: don't recentre the viewport on
+        # every insert, and use a fixed tab stop so layout skips the
+        # per-block font metrics query.
+        self.editor.setCenterOnScroll(False)
+        self.editor.setTabStopDistance(32)
+        # Fine-grained wiring: cursor moves only touch the Ln/Col label,
+        # and the tab title only refreshes when the dirty flag flips —
+        # not on every keystroke via textChanged.
+        self.editor.cursorPositionChanged.connect(self.cursor_moved.emit)
+        self.editor.document().modificationChanged.connect(self._on_modified)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        lay.setContentsMargins(12, 12, 12, 12)
+        lay.addWidget(self.editor)
+
+        self.apply_font()
+        self.apply_word_wrap(self.state.word_wrap)
+
+    def _on_modified(self, _modified: bool):
+        self.dirty_changed.emit()
+
+    def apply_font(self):
+        f = QtGui.QFont(self.state.font_family, self.state.font_size)
+        self.editor.setFont(f)
+
+    def apply_word_wrap(self, enabled: bool):
+        self.editor.setLineWrapMode(
+            QtWidgets.QPlainTextEdit.WidgetWidth if enabled else QtWidgets.QPlainTextEdit.NoWrap
+        )
+
+    def is_dirty(self) -> bool:
+        return self.editor.document().isModified()
+
+    def title(self) -> str:
+        name = _basename(self.path) if self.path else "Untitled"
+        return name + (" •" if self.is_dirty() else "")
+
+    def load_file(self, path: str):
+        if os.path.getsize(path) > LARGE_FILE_BYTES:
+            self._load_streaming(path)
+            return
+        data = Path(path).read_bytes()
+        text = data.decode("utf-8", errors="replace")
+        # Skip per-block undo-command allocations while the document is
+        # rebuilt wholesale; the streamed path already does the same.
+        doc = self.editor.document()
+        doc.setUndoRedoEnabled(False)
+        self.editor.setPlainText(text)
+        doc.setUndoRedoEnabled(True)
+        self.path = path
+        doc.setModified(False)
+        self.changed.emit()
+
+    def _load_streaming(self, path: str):
+        # Read/decode on a pool thread; chunks come back through queued
+        # signals, so paint and input stay live during a multi-MB load.
+        doc = self.editor.document()
+        doc.setUndoRedoEnabled(False)
+        self.editor.clear()
+        # Lock the tab until the job finishes: saving a half-loaded
+        # buffer over the original file would truncate it, so the path
+        # is only adopted in _finish_load and edits are blocked.
+        self.editor.setReadOnly(True)
+        self._pending_path = path
+
+        job = _LoadJob(path)
+        job.signals.chunk.connect(self._append_chunk)
+        job.signals.finished.connect(self._finish_load)
+        job.signals.failed.connect(self._fail_load)
+        self._load_job = job  # keep the signal relay alive while running
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _append_chunk(self, chunk: str):
+        cursor = self.editor.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText(chunk)
+
+    def _finish_load(self):
+        self._load_job = None
+        self.path = self._pending_path
+        self._pending_path = None
+        self.editor.setReadOnly(False)
+        doc = self.editor.document()
+        doc.setUndoRedoEnabled(True)
+        doc.setModified(False)
+        self.changed.emit()
+
+    def _fail_load(self, msg: str):
+        self._load_job = None
+        # Leave the tab pathless: whatever partial text survived must
+        # not be saveable over the original file.
+        self._pending_path = None
+        self.path = None
+        self.editor.setReadOnly(False)
+        self.editor.document().setUndoRedoEnabled(True)
+        self.load_failed.emit(msg)
+
+    def save_to(self, path: str) -> bool:
+        """Queue an async save; returns False if it was refused rather
+        than queued, after surfacing the reason via save_failed."""
+        if self._load_job is not None:
+            self.save_failed.emit("file is still loading")
+            return False
+        if self._save_job is not None:
+            # Two concurrent _SaveJobs could complete out of order and
+            # let a stale result clobber path/modified state.
+            self.save_failed.emit("a save is already in progress")
+            return False
+        data = self.editor.toPlainText().encode("utf-8")
+        job = _SaveJob(path, data)
+        # Only mark the document clean once the write actually landed;
+        # claiming success at queue time would disarm the dirty-close
+        # prompts even if the job later fails.
+        job.signals.finished.connect(functools.partial(self._finish_save, path))
+        job.signals.failed.connect(self._fail_save)
+        self._save_job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+        return True
+
+    def _finish_save(self, path: str):
+        self._save_job = None
+        self.path = path
+        self.editor.document().setModified(False)
+        self.changed.emit()
+        self.saved.emit(path)
+
+    def save_now(self, path: str):
+        """Synchronous save for the close paths, where the event loop
+        may not outlive a pool job. Raises on failure."""
+        if self._load_job is not None:
+            raise RuntimeError("file is still loading")
+        _write_atomic(path, self.editor.toPlainText().encode("utf-8"))
+        self.path = path
+        self.editor.document().setModified(False)
+        self.changed.emit()
+
+    def _fail_save(self, msg: str):
+        self._save_job = None
+        # The buffer still holds unsaved content: keep the dirty flag so
+        # close_tab/closeEvent prompt again.
+        self.editor.document().setModified(True)
+        self.save_failed.emit(msg)
+
+
+# ----------------------------
+# Theme (MUST look like your image)
+# ----------------------------
+
+# Dark, muted, soft: matches your screenshot vibe. Kept at module
+# scope and applied once on the QApplication so Qt parses the CSS a
+# single time, before any widgets exist.
+_STYLESHEET = """
+        QMainWindow { background: #1e1e1e; }
+        QWidget { color: rgba(255,255,255,0.60); font-size: 13px; }
+
+        /* Menu bar: subtle, almost invisible */
+        QMenuBar {
+            background: rgba(0,0,0,0.15);
+            border: 0;
+            padding: 2px 4px;
+        }
+        QMenuBar::item {
+            padding: 6px 10px;
+            color: rgba(255,255,255,0.38);
+        }
+        QMenuBar::item:selected {
+            background: rgba(255,255,255,0.06);
+            border-radius: 8px;
+            color: rgba(255,255,255,0.55);
+        }
+
+        QMenu {
+            background: #242424;
+            border: 1px solid rgba(255,255,255,0.10);
+            padding: 6px;
+            border-radius: 10px;
+        }
+        QMenu::item { padding: 8px 12px; border-radius: 8px; color: rgba(255,255,255,0.60); }
+        QMenu::item:selected { background: rgba(255,255,255,0.08); }
+
+        /* Left rail */
+        QFrame#Rail {
+            background: #121212;
+            border-right: 1px solid rgba(255,255,255,0.08);
+        }
+
+        /* Big center title */
+        QLabel#StartTitle {
+            font-size: 84px;
+            font-weight: 300;
+            color: rgba(255,255,255,0.14);
+            letter-spacing: 1px;
+        }
+
+        /* Start cards */
+        QToolButton#StartCard {
+            background: rgba(255,255,255,0.06);
+            border: 1px solid rgba(255,255,255,0.10);
+            border-radius: 18px;
+            padding-top: 14px;
+            color: rgba(255,255,255,0.36);
+        }
+        QToolButton#StartCard:hover {
+            background: rgba(255,255,255,0.08);
+            border: 1px solid rgba(255,255,255,0.14);
+            color: rgba(255,255,255,0.52);
+        }
+        QToolButton#StartCard:pressed {
+            background: rgba(255,255,255,0.05);
+        }
+
+        /* Tabs + editor (kept low-contrast) */
+        QTabWidget::pane { border: 0; background: transparent; }
+        QTabBar::tab {
+            background: rgba(255,255,255,0.05);
+            border: 1px solid rgba(255,255,255,0.08);
+            padding: 8px 12px;
+            margin-right: 6px;
+            border-top-left-radius: 10px;
+            border-top-right-radius: 10px;
+            color: rgba(255,255,255,0.50);
+        }
+        QTabBar::tab:selected {
+            background: rgba(255,255,255,0.07);
+            border-color: rgba(255,255,255,0.12);
+            color: rgba(255,255,255,0.70);
+        }
+
+        QPlainTextEdit {
+            background: #171717;
+            border: 1px solid rgba(255,255,255,0.10);
+            border-radius: 14px;
+            padding: 12px;
+            color: rgba(255,255,255,0.72);
+            selection-background-color: rgba(255,255,255,0.16);
+        }
+
+        QStatusBar {
+            background: rgba(0,0,0,0.15);
+            border-top: 1px solid rgba(255,255,255,0.08);
+            color: rgba(255,255,255,0.40);
+        }
+    """
+
+
+# ----------------------------
+# Main Window
+# ----------------------------
+
+class MainWindow(QtWidgets.QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.state = load_state()
+        self.setWindowTitle(APP_NAME)
+        self.resize(1200, 720)
+
+        # Status bar first (so any updates won't crash)
+        self._build_status_bar()
+
+        # Coalesce bursts of status-bar updates to at most one per frame.
+        self._sb_timer = QtCore.QTimer(self)
+        self._sb_timer.setSingleShot(True)
+        self._sb_timer.setInterval(16)
+        self._sb_timer.timeout.connect(self._do_update_status_bar)
+
+        # Coalesce settings writes: every open/save touches recent files,
+        # so batch them behind a short timer and skip identical payloads.
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_state)
+        self._last_state_payload: bytes = b""
+
+        # Editor tabs
+        self.tabs = QtWidgets.QTabWidget()
+        self.tabs.setDocumentMode(True)
+        self.tabs.setMovable(True)
+        self.tabs.setTabsClosable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self.update_status_bar)
+
+        # Stack: Start <-> Editor. The start page, actions and menus are
+        # built lazily on first show (see showEvent) so none of their
+        # widget/icon allocations sit on the startup critical path.
+        self.start_page: Optional[StartPage] = None
+        self.stack = QtWidgets.QStackedWidget()
+        self.stack.addWidget(self.tabs)
+        self.setCentralWidget(self.stack)
+
+        self._recent_actions: list[QtGui.QAction] = []
+        self._ui_built = False
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        if not self._ui_built:
+            self._ui_built = True
+
+            # Start page (the image)
+            self.start_page = StartPage(APP_NAME)
+            self.start_page.new_file_clicked.connect(self.on_start_new_file)
+            self.start_page.open_folder_clicked.connect(self.on_start_open_folder)
+            self.stack.insertWidget(0, self.start_page)  # tabs shift to 1
+
+            self._build_actions()
+            self._build_menus()
+
+            self.show_start()
+        super().showEvent(event)
+
+    # ---------------- UI: Status Bar ----------------
+
+    def _build_status_bar(self):
+        sb = QtWidgets.QStatusBar()
+        self.setStatusBar(sb)
+
+        self.lbl_file = QtWidgets.QLabel("")
+        self.lbl_pos = QtWidgets.QLabel("")
+        self.lbl_dirty = QtWidgets.QLabel("")
+
+        self.lbl_file.setMinimumWidth(420)
+
+        sb.addWidget(self.lbl_file, 1)
+        sb.addPermanentWidget(self.lbl_pos)
+        sb.addPermanentWidget(self.lbl_dirty)
+
+    def update_status_bar(self):
+        self._sb_timer.start()
+
+    def _do_update_status_bar(self):
+        # If we're on start page, keep it quiet like the screenshot
+        if self.stack.currentIndex() == 0:
+            self.lbl_file.setText("")
+            self.lbl_pos.setText("")
+            self.lbl_dirty.setText("")
+            return
+
+        tab = self.current_tab()
+        if not tab:
+            self.lbl_file.setText("Untitled")
+            self.lbl_pos.setText("Ln 1, Col 1")
+            self.lbl_dirty.setText("Saved")
+            return
+
+        path = tab.path or "Untitled"
+        self.lbl_file.setText(elide_middle(path, 70))
+
+        cursor = tab.editor.textCursor()
+        ln = cursor.blockNumber() + 1
+        col = cursor.positionInBlock() + 1
+        self.lbl_pos.setText(f"Ln {ln}, Col {col}")
+        self.lbl_dirty.setText("Modified" if tab.is_dirty() else "Saved")
+
+    # ---------------- Navigation ----------------
+
+    def show_start(self):
+        self.stack.setCurrentIndex(0)
+        self.update_status_bar()
+
+    def show_editor(self):
+        self.stack.setCurrentIndex(1)
+        self.update_status_bar()
+
+    def on_start_new_file(self):
+        self.show_editor()
+        self.new_tab()
+
+    def on_start_open_folder(self):
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Open Folder", str(Path.home()))
+        if not folder:
+            return
+        # Keep the same look; just switch to editor for now.
+        self.show_editor()
+        self.new_tab()
+        self.statusBar().showMessage(f"Opened folder: {folder}", 4000)
+
+    # ---------------- Tabs / Editor ----------------
+
+    def current_tab(self) -> Optional[DocumentTab]:
+        w = self.tabs.currentWidget()
+        return w if isinstance(w, DocumentTab) else None
+
+    def new_tab(self):
+        tab = DocumentTab(self.state)
+        tab.changed.connect(self.refresh_tab_title)
+        tab.saved.connect(self._add_recent)
+        tab.cursor_moved.connect(self._update_cursor_pos)
+        tab.dirty_changed.connect(self.refresh_tab_title)
+        tab.load_failed.connect(self._show_load_error)
+        tab.save_failed.connect(self._show_save_error)
+
+        idx = self.tabs.addTab(tab, tab.title())
+        self.tabs.setCurrentIndex(idx)
+        tab.editor.setFocus()
+
+        self.refresh_tab_title()
+
+    def _update_cursor_pos(self):
+        if self.stack.currentIndex() == 0:
+            return
+        tab = self.current_tab()
+        if not tab:
+            return
+        cursor = tab.editor.textCursor()
+        ln = cursor.blockNumber() + 1
+        col = cursor.positionInBlock() + 1
+        self.lbl_pos.setText(f"Ln {ln}, Col {col}")
+
+    def _show_load_error(self, msg: str):
+        QtWidgets.QMessageBox.critical(self, "Open failed", msg)
+
+    def _show_save_error(self, msg: str):
+        QtWidgets.QMessageBox.critical(self, "Save failed", msg)
+
+    def refresh_tab_title(self):
+        # Completion signals arrive asynchronously, possibly after the
+        # user switched tabs — re-title the tab that emitted, falling
+        # back to the current one for direct calls.
+        tab = self.sender()
+        if not isinstance(tab, DocumentTab):
+            tab = self.current_tab()
+        if tab:
+            idx = self.tabs.indexOf(tab)
+            if idx >= 0:
+                # setTabText invalidates tab-bar geometry even for the
+                # same string, so only call it on a real change.
+                title = tab.title()
+                if title != tab._last_title:
+                    tab._last_title = title
+                    self.tabs.setTabText(idx, title)
+        self.update_status_bar()
+
+    def close_tab(self, index: int):
+        if index < 0:
+            return
+        tab = self.tabs.widget(index)
+        if not isinstance(tab, DocumentTab):
+            return
+
+        if tab.is_dirty():
+            resp = QtWidgets.QMessageBox.question(
+                self,
+                "Unsaved changes",
+                f"Save changes to {_basename(tab.path) if tab.path else 'Untitled'}?",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel
+            )
+            if resp == QtWidgets.QMessageBox.Cancel:
+                return
+            if resp == QtWidgets.QMessageBox.Yes:
+                if not self._save_tab(tab):
+                    return
+
+        self.tabs.removeTab(index)
+        tab.deleteLater()
+
+        if self.tabs.count() == 0:
+            # If no tabs, go back to the start screen (like a “real app”)
+            self.show_start()
+        else:
+            self.update_status_bar()
+
+    # ---------------- File Actions ----------------
+
+    def open_file(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Open File", str(Path.home()),
+            "Text Files (*.txt *.md *.log *.json *.py);;All Files (*.*)"
+        )
+        if not path:
+            return
+
+        self.show_editor()
+
+        # focus existing tab if already open
+        for i in range(self.tabs.count()):
+            t = self.tabs.widget(i)
+            if isinstance(t, DocumentTab) and t.path == path:
+                self.tabs.setCurrentIndex(i)
+                return
+
+        # open into new tab
+        self.new_tab()
+        tab = self.current_tab()
+        if not tab:
+            return
+        try:
+            tab.load_file(path)
+            self._add_recent(path)
+            self.refresh_tab_title()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Open failed", str(e))
+
+    def save_current(self):
+        tab = self.current_tab()
+        if not tab:
+            return
+        if tab.path:
+            # Recents/title bookkeeping happens on the saved/changed
+            # signals once the write actually lands.
+            tab.save_to(tab.path)
+        else:
+            self.save_current_as()
+
+    def save_current_as(self):
+        tab = self.current_tab()
+        if not tab:
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save As", str(Path.home() / "Untitled.txt"),
+            "Text Files (*.txt);;Markdown (*.md);;All Files (*.*)"
+        )
+        if not path:
+            return
+        tab.save_to(path)
+
+    def _save_tab(self, tab: DocumentTab) -> bool:
+        # Close path: save synchronously so a True return really means
+        # the bytes are on disk — a queued pool job could be discarded
+        # when the event loop shuts down right after.
+        if tab.path:
+            try:
+                tab.save_now(tab.path)
+                self._add_recent(tab.path)
+                return True
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
+                return False
+        # Save As
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save As", str(Path.home() / "Untitled.txt"),
+            "Text Files (*.txt);;Markdown (*.md);;All Files (*.*)"
+        )
+        if not path:
+            return False
+        try:
+            tab.save_now(path)
+            self._add_recent(path)
+            return True
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
+            return False
+
+    # ---------------- Settings persistence ----------------
+
+    def _schedule_save_state(self):
+        self._save_timer.start()
+
+    def _flush_state(self):
+        payload = _dumps(self.state.__dict__)
+        if payload == self._last_state_payload:
+            return
+        # Only remember the payload once it's on disk, so a failed
+        # write gets retried on the next flush instead of skipped.
+        if _write_settings(payload):
+            self._last_state_payload = payload
+
+    # ---------------- Recent Files ----------------
+
+    def _add_recent(self, path: str):
+        p = _resolve_cached(path)
+        # dict preserves insertion order, giving an O(1)-ish dedupe
+        # instead of the old `in` + remove() double scan.
+        d = dict.fromkeys(self.state.recent_files)
+        d.pop(p, None)
+        self.state.recent_files = [p, *d][:10]
+        self._schedule_save_state()
+        self._update_recent_menu(p)
+
+    def _update_recent_menu(self, p: str):
+        # Incremental update: move a hit to the top, or insert one new
+        # action and drop the overflow — no O(N) clear-and-recreate.
+        if not hasattr(self, "menu_recent"):
+            return
+        acts = self._recent_actions
+        if not acts:
+            # Menu currently shows the placeholder; do a full build once.
+            self._rebuild_recent_menu()
+            return
+        hit = next((a for a in acts if a.data() == p), None)
+        if hit is not None:
+            if acts[0] is hit:
+                return
+            self.menu_recent.removeAction(hit)
+            acts.remove(hit)
+            self.menu_recent.insertAction(acts[0], hit)
+            acts.insert(0, hit)
+            return
+        act = QtGui.QAction(elide_middle(p, 64), self.menu_recent)
+        act.setData(p)
+        act.triggered.connect(self._open_recent_from_sender)
+        self.menu_recent.insertAction(acts[0], act)
+        acts.insert(0, act)
+        while len(acts) > len(self.state.recent_files):
+            overflow = acts.pop()
+            self.menu_recent.removeAction(overflow)
+            overflow.deleteLater()
+
+    def _rebuild_recent_menu(self):
+        if not hasattr(self, "menu_recent"):
+            return
+        self.menu_recent.clear()
+        self._recent_actions = []
+        if not self.state.recent_files:
+            a = self.menu_recent.addAction("(No recent files)")
+            a.setEnabled(False)
+            return
+        for p in self.state.recent_files:
+            act = self.menu_recent.addAction(elide_middle(p, 64))
+            act.setData(p)
+            act.triggered.connect(self._open_recent_from_sender)
+            self._recent_actions.append(act)
+        self.menu_recent.addSeparator()
+        clear = self.menu_recent.addAction("Clear recent")
+        clear.triggered.connect(self._clear_recent)
+
+    def _open_recent_from_sender(self):
+        # One shared slot for all recent actions; the path rides along
+        # as the action's data instead of a per-entry closure.
+        act = self.sender()
+        if isinstance(act, QtGui.QAction):
+            self._open_recent(act.data())
+
+    def _open_recent(self, path: str):
+        if not Path(path).exists():
+            QtWidgets.QMessageBox.warning(self, "Missing file", "That file no longer exists.")
+            self.state.recent_files = [p for p in self.state.recent_files if p != path]
+            self._schedule_save_state()
+            self._rebuild_recent_menu()
+            return
+        self.show_editor()
+        # open it
+        self.new_tab()
+        tab = self.current_tab()
+        if tab:
+            tab.load_file(_resolve_cached(path))
+            self.refresh_tab_title()
+
+    def _clear_recent(self):
+        self.state.recent_files = []
+        _resolve_cached.cache_clear()
+        self._schedule_save_state()
+        self._rebuild_recent_menu()
+
+    # ---------------- Menus / Actions ----------------
+
+    def _build_actions(self):
+        self.act_new = QtGui.QAction("New File", self)
+        self.act_new.setShortcut(QtGui.QKeySequence.New)
+        self.act_new.triggered.connect(self.on_start_new_file)
+
+        self.act_open = QtGui.QAction("Open…", self)
+        self.act_open.setShortcut(QtGui.QKeySequence.Open)
+        self.act_open.triggered.connect(self.open_file)
+
+        self.act_save = QtGui.QAction("Save", self)
+        self.act_save.setShortcut(QtGui.QKeySequence.Save)
+        self.act_save.triggered.connect(self.save_current)
+
+        self.act_save_as = QtGui.QAction("Save As…", self)
+        self.act_save_as.setShortcut(QtGui.QKeySequence.SaveAs)
+        self.act_save_as.triggered.connect(self.save_current_as)
+
+        self.act_quit = QtGui.QAction("Quit", self)
+        self.act_quit.setShortcut(QtGui.QKeySequence.Quit)
+        self.act_quit.triggered.connect(self.close)
+
+        self.act_about = QtGui.QAction("About NotePy", self)
+        self.act_about.triggered.connect(self._about)
+
+    def _build_menus(self):
+        mb = self.menuBar()
+
+        # Must match your screenshot labels
+        m_file = mb.addMenu("File")
+        m_edit = mb.addMenu("Edit")
+        m_view = mb.addMenu("View")
+        m_window = mb.addMenu("Window")
+        m_about = mb.addMenu("About")
+
+        m_file.addAction(self.act_new)
+        m_file.addAction(self.act_open)
+
+        self.menu_recent = m_file.addMenu("Open Recent")
+        self._rebuild_recent_menu()
+
+        m_file.addSeparator()
+        m_file.addAction(self.act_save)
+        m_file.addAction(self.act_save_as)
+        m_file.addSeparator()
+        m_file.addAction(self.act_quit)
+
+        # basic edit bindings: one dispatcher, one current_tab() lookup
+        for text, shortcut, op in (
+            ("Undo", QtGui.QKeySequence.Undo, "undo"),
+            ("Redo", QtGui.QKeySequence.Redo, "redo"),
+            ("Cut", QtGui.QKeySequence.Cut, "cut"),
+            ("Copy", QtGui.QKeySequence.Copy, "copy"),
+            ("Paste", QtGui.QKeySequence.Paste, "paste"),
+        ):
+            act = QtGui.QAction(text, self)
+            act.setShortcut(shortcut)
+            act.triggered.connect(functools.partial(self._editor_op, op))
+            m_edit.addAction(act)
+            if op == "redo":
+                m_edit.addSeparator()
+
+        # view placeholders (keeps menus like the image)
+        act_home = QtGui.QAction("Home", self)
+        act_home.triggered.connect(self.show_start)
+        m_view.addAction(act_home)
+
+        m_about.addAction(self.act_about)
+
+    def _editor_op(self, op: str, checked: bool = False):
+        tab = self.current_tab()
+        if tab:
+            getattr(tab.editor, op)()
+
+    def _about(self):
+       msg = QtWidgets.QMessageBox(self)
+       msg.setWindowTitle("About NotePy")
+       msg.setTextFormat(QtCore.Qt.RichText)
+       msg.setText(
+        """
+        <b>NotePy</b><br>
+        A notepad app built by Charlie Blaize<br>
+        Version 1.0.0 (Open Source)<br><br>
+        <a href="https://github.com/CharlieB8086/NotePy">GitHub Repository</a>
+        """
+    )
+       msg.setStandardButtons(QtWidgets.QMessageBox.Ok)
+       msg.exec()
+
+
+    # ---------------- Close safety ----------------
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Ask to save dirty tabs
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            if isinstance(tab, DocumentTab) and tab.is_dirty():
+                self.tabs.setCurrentIndex(i)
+                resp = QtWidgets.QMessageBox.question(
+                    self,
+                    "Unsaved changes",
+                    f"Save changes to {_basename(tab.path) if tab.path else 'Untitled'}?",
+                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel
+                )
+                if resp == QtWidgets.QMessageBox.Cancel:
+                    event.ignore()
+                    return
+                if resp == QtWidgets.QMessageBox.Yes:
+                    if not self._save_tab(tab):
+                        event.ignore()
+                        return
+
+        self._save_timer.stop()
+        self._flush_state()
+        # Let any background saves queued before the prompts finish;
+        # tearing down mid-job would discard their QSaveFile commits.
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        event.accept()
+
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main():
+    QtCore.QCoreApplication.setOrganizationName(ORG_NAME)
+    QtCore.QCoreApplication.setApplicationName(APP_NAME)
+
+    app = QtWidgets.QApplication(sys.argv)
+    app.setStyleSheet(_STYLESHEET)
+
+    win = MainWindow()
+    win.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()